@@ -41,19 +41,13 @@ def assert_query_stats(test_case, buffered_cursor, read_ios_assert, write_ios_as
     """
     consumed_ios = buffered_cursor.get_consumed_ios()
     if read_ios_assert is not None:
-        test_case.assertIsNotNone(consumed_ios)
-        read_ios = consumed_ios.get('ReadIOs')
-
-        test_case.assertEqual(read_ios, read_ios_assert)
+        test_case.assertEqual(consumed_ios.get('ReadIOs'), read_ios_assert)
     else:
         test_case.assertEqual(consumed_ios, None)
 
     timing_information = buffered_cursor.get_timing_information()
     if timing_information_assert is not None:
-        test_case.assertIsNotNone(timing_information)
-        processing_time_milliseconds = timing_information.get('ProcessingTimeMilliseconds')
-
-        test_case.assertEqual(processing_time_milliseconds, timing_information_assert)
+        test_case.assertEqual(timing_information.get('ProcessingTimeMilliseconds'), timing_information_assert)
     else:
         test_case.assertEqual(timing_information_assert, None)
 
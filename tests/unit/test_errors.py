@@ -16,93 +16,104 @@ from pyqldb.errors import is_occ_conflict_exception, is_invalid_session_exceptio
     is_bad_request_exception, is_transaction_expired_exception
 
 
+BAD_REQUEST_RESPONSE = {'Error': {'Code': 'BadRequestException'}}
+NOT_BAD_REQUEST_RESPONSE = {'Error': {'Code': 'NotBadRequestException'}}
+TRANSACTION_EXPIRED_RESPONSE = {'Error': {'Code': 'InvalidSessionException', 'Message': 'Transaction xyz has expired'}}
+TRANSACTION_NOT_EXPIRED_RESPONSE = {'Error': {'Code': 'InvalidSessionException',
+                                              'Message': 'Transaction xyz has not expired'}}
+OCC_CONFLICT_RESPONSE = {'Error': {'Code': 'OccConflictException'}}
+NOT_OCC_CONFLICT_RESPONSE = {'Error': {'Code': 'NotOccConflictException'}}
+INVALID_SESSION_RESPONSE = {'Error': {'Code': 'InvalidSessionException'}}
+NOT_INVALID_SESSION_RESPONSE = {'Error': {'Code': 'NotInvalidSessionException'}}
+RETRYABLE_500_RESPONSE = {'ResponseMetadata': {'HTTPStatusCode': 500}, 'Error': {'Code': 'RetryableException'}}
+RETRYABLE_503_RESPONSE = {'ResponseMetadata': {'HTTPStatusCode': 503}, 'Error': {'Code': 'RetryableException'}}
+NO_HTTP_RESPONSE_RESPONSE = {'Error': {'Code': 'NoHttpResponseException'}, 'ResponseMetadata': {'HTTPStatusCode': 200}}
+SOCKET_TIMEOUT_RESPONSE = {'Error': {'Code': 'SocketTimeoutException'}, 'ResponseMetadata': {'HTTPStatusCode': 200}}
+OCC_CONFLICT_100_RESPONSE = {'Error': {'Code': 'OccConflictException'}, 'ResponseMetadata': {'HTTPStatusCode': 100}}
+INVALID_SESSION_100_RESPONSE = {'Error': {'Code': 'InvalidSessionException'},
+                                'ResponseMetadata': {'HTTPStatusCode': 100}}
+TRANSACTION_EXPIRED_100_RESPONSE = {'Error': {'Code': 'InvalidSessionException',
+                                              'Message': 'Transaction xyz has expired'},
+                                    'ResponseMetadata': {'HTTPStatusCode': 100}}
+NOT_RETRYABLE_RESPONSE = {'Error': {'Code': 'NotRetriableException'}, 'ResponseMetadata': {'HTTPStatusCode': 200}}
+
+
 class TestErrors(TestCase):
 
     def test_is_bad_request_exception_true(self):
-        clientError = ClientError({'Error': {'Code': 'BadRequestException'}}, 'SendCommand')
+        clientError = ClientError(BAD_REQUEST_RESPONSE, 'SendCommand')
         self.assertTrue(is_bad_request_exception(clientError))
 
     def test_is_bad_request_exception_false(self):
-        clientError = ClientError({'Error': {'Code': 'NotBadRequestException'}}, 'SendCommand')
+        clientError = ClientError(NOT_BAD_REQUEST_RESPONSE, 'SendCommand')
         self.assertFalse(is_bad_request_exception(clientError))
 
     def test_is_bad_request_exception_not_client_error(self):
         self.assertFalse(is_bad_request_exception(Exception()))
 
     def test_is_transaction_expired_exception_true(self):
-        clientError = ClientError({'Error': {'Code': 'InvalidSessionException',
-                                             'Message': 'Transaction xyz has expired'}}, 'SendCommand')
+        clientError = ClientError(TRANSACTION_EXPIRED_RESPONSE, 'SendCommand')
         self.assertTrue(is_transaction_expired_exception(clientError))
 
     def test_is_transaction_expired_exception_false(self):
-        clientError = ClientError({'Error': {'Code': 'InvalidSessionException',
-                                             'Message': 'Transaction xyz has not expired'}}, 'SendCommand')
+        clientError = ClientError(TRANSACTION_NOT_EXPIRED_RESPONSE, 'SendCommand')
         self.assertFalse(is_transaction_expired_exception(clientError))
 
     def test_is_transaction_expired_exception_not_client_error(self):
         self.assertFalse(is_transaction_expired_exception(Exception()))
 
     def test_is_occ_conflict_exception_true(self):
-        clientError = ClientError({'Error': {'Code': 'OccConflictException'}}, 'SendCommand')
+        clientError = ClientError(OCC_CONFLICT_RESPONSE, 'SendCommand')
         self.assertTrue(is_occ_conflict_exception(clientError))
 
     def test_is_occ_conflict_exception_false(self):
-        clientError = ClientError({'Error': {'Code': 'NotOccConflictException'}}, 'SendCommand')
+        clientError = ClientError(NOT_OCC_CONFLICT_RESPONSE, 'SendCommand')
         self.assertFalse(is_occ_conflict_exception(clientError))
 
     def test_is_occ_conflict_exception_not_client_error(self):
         self.assertFalse(is_occ_conflict_exception(Exception()))
 
     def test_is_invalid_session_true(self):
-        clientError = ClientError({'Error': {'Code': 'InvalidSessionException'}}, 'SendCommand')
+        clientError = ClientError(INVALID_SESSION_RESPONSE, 'SendCommand')
         self.assertTrue(is_invalid_session_exception(clientError))
 
     def test_is_invalid_session_false(self):
-        clientError = ClientError({'Error': {'Code': 'NotInvalidSessionException'}}, 'SendCommand')
+        clientError = ClientError(NOT_INVALID_SESSION_RESPONSE, 'SendCommand')
         self.assertFalse(is_invalid_session_exception(clientError))
 
     def test_is_invalid_session_not_client_error(self):
         self.assertFalse(is_invalid_session_exception(Exception()))
 
     def test_is_retryable_exception_is_500_response_code(self):
-        clientError = ClientError({'ResponseMetadata': {'HTTPStatusCode': 500},
-                                   'Error': {'Code': 'RetryableException'}}, 'SendCommand')
+        clientError = ClientError(RETRYABLE_500_RESPONSE, 'SendCommand')
         self.assertTrue(is_retriable_exception(clientError))
 
     def test_is_retryable_exception_is_503_response_code(self):
-        clientError = ClientError({'ResponseMetadata': {'HTTPStatusCode': 503},
-                                   'Error': {'Code': 'RetryableException'}}, 'SendCommand')
+        clientError = ClientError(RETRYABLE_503_RESPONSE, 'SendCommand')
         self.assertTrue(is_retriable_exception(clientError))
 
     def test_is_retryable_exception_is_NoHttpResponseException(self):
-        clientError = ClientError({'Error': {'Code': 'NoHttpResponseException'},
-                                   'ResponseMetadata': {'HTTPStatusCode': 200}}, 'SendCommand')
+        clientError = ClientError(NO_HTTP_RESPONSE_RESPONSE, 'SendCommand')
         self.assertTrue(is_retriable_exception(clientError))
 
     def test_is_retryable_exception_is_SocketTimeoutException(self):
-        clientError = ClientError({'Error': {'Code': 'SocketTimeoutException'},
-                                   'ResponseMetadata': {'HTTPStatusCode': 200}}, 'SendCommand')
+        clientError = ClientError(SOCKET_TIMEOUT_RESPONSE, 'SendCommand')
         self.assertTrue(is_retriable_exception(clientError))
 
     def test_is_retryable_exception_is_occ_conflict_exception(self):
-        clientError = ClientError({'Error': {'Code': 'OccConflictException'},
-                                   'ResponseMetadata': {'HTTPStatusCode': 100}}, 'SendCommand')
+        clientError = ClientError(OCC_CONFLICT_100_RESPONSE, 'SendCommand')
         self.assertTrue(is_retriable_exception(clientError))
 
     def test_is_retryable_exception_is_invalid_session_exception(self):
-        clientError = ClientError({'Error': {'Code': 'InvalidSessionException'},
-                                   'ResponseMetadata': {'HTTPStatusCode': 100}}, 'SendCommand')
+        clientError = ClientError(INVALID_SESSION_100_RESPONSE, 'SendCommand')
         self.assertTrue(is_retriable_exception(clientError))
 
     def test_is_retryable_exception_is_expired_transaction_exception(self):
-        clientError = ClientError({'Error': {'Code': 'InvalidSessionException',
-                                             'Message': 'Transaction xyz has expired'},
-                                   'ResponseMetadata': {'HTTPStatusCode': 100}}, 'SendCommand')
+        clientError = ClientError(TRANSACTION_EXPIRED_100_RESPONSE, 'SendCommand')
         self.assertFalse(is_retriable_exception(clientError))
 
     def test_is_retryable_exception_false(self):
-        clientError = ClientError({'Error': {'Code': 'NotRetriableException'},
-                                   'ResponseMetadata': {'HTTPStatusCode': 200}}, 'SendCommand')
+        clientError = ClientError(NOT_RETRYABLE_RESPONSE, 'SendCommand')
         self.assertFalse(is_retriable_exception(clientError))
 
     def test_is_retryable_exception_not_client_exception(self):
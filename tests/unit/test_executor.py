@@ -9,7 +9,7 @@
 # CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import sentinel
 
 from pyqldb.errors import LambdaAbortedError
 from pyqldb.execution.executor import Executor
@@ -22,26 +22,39 @@ MOCK_PARAMETER_2 = 'bar'
 MOCK_CLIENT_ERROR_MESSAGE = {'Error': {'Code': MOCK_ERROR_CODE, 'Message': MOCK_MESSAGE}}
 
 
-@patch('pyqldb.transaction.transaction.Transaction')
+class _StubTransaction:
+    """
+    Minimal stand-in for a transaction exposing only what the executor touches.
+    """
+    transaction_id = 'txnId'
+
+    def __init__(self, result=None):
+        self.calls = []
+        self._result = result
+
+    def _execute_statement(self, statement, *parameters):
+        self.calls.append((statement,) + parameters)
+        return self._result
+
+
 class TestExecutor(TestCase):
 
-    def test_Executor(self, mock_transaction):
-        mock_transaction.transaction_id = 'txnId'
-        executor = Executor(mock_transaction)
+    def test_Executor(self):
+        transaction = _StubTransaction()
+        executor = Executor(transaction)
 
-        self.assertEqual(executor._transaction, mock_transaction)
+        self.assertEqual(executor._transaction, transaction)
         self.assertEqual(executor.transaction_id, 'txnId')
 
-    def test_abort(self, mock_transaction):
-        executor = Executor(mock_transaction)
+    def test_abort(self):
+        executor = Executor(_StubTransaction())
 
         self.assertRaises(LambdaAbortedError, executor.abort)
 
-    @patch('pyqldb.cursor.stream_cursor.StreamCursor')
-    def test_execute_statement(self, mock_cursor, mock_transaction):
-        mock_transaction._execute_statement.return_value = mock_cursor
-        executor = Executor(mock_transaction)
+    def test_execute_statement(self):
+        transaction = _StubTransaction(sentinel.cursor)
+        executor = Executor(transaction)
 
         cursor = executor.execute_statement(MOCK_STATEMENT, MOCK_PARAMETER_1, MOCK_PARAMETER_2)
-        mock_transaction._execute_statement.assert_called_once_with(MOCK_STATEMENT, MOCK_PARAMETER_1, MOCK_PARAMETER_2)
-        self.assertEqual(cursor, mock_cursor)
+        self.assertEqual(transaction.calls, [(MOCK_STATEMENT, MOCK_PARAMETER_1, MOCK_PARAMETER_2)])
+        self.assertEqual(cursor, sentinel.cursor)
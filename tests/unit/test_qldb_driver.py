@@ -8,16 +8,21 @@
 # or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
 # CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
-from queue import Queue
+from collections import deque
+from copy import copy
+from queue import Empty
 from unittest import TestCase
-from unittest.mock import call, patch, Mock
+from unittest.mock import call, patch, sentinel, DEFAULT, Mock
 
 from botocore.exceptions import ClientError
 from botocore.config import Config
 from boto3.session import Session
+from pyqldb.communication import session_client as session_client_module
 from pyqldb.config.retry_config import RetryConfig
+from pyqldb.driver import qldb_driver as qldb_driver_module
 from pyqldb.driver.qldb_driver import QldbDriver, SERVICE_DESCRIPTION
 from pyqldb.errors import DriverClosedError, ExecuteError, SessionPoolEmptyError
+from pyqldb.session.qldb_session import QldbSession
 
 from .helper_functions import assert_execute_error
 
@@ -29,95 +34,163 @@ DEFAULT_BACKOFF_BASE = 10
 DEFAULT_TIMEOUT_SECONDS = 0.001
 DEFAULT_TRANSACTION_ID = 1
 EMPTY_STRING = ''
-MOCK_CONFIG = Config(user_agent_extra='user_agent')
+MOCK_USER_AGENT = 'user_agent'
 MOCK_LEDGER_NAME = 'QLDB'
 MOCK_MESSAGE = 'message'
-MOCK_BOTO3_SESSION = Session()
 MOCK_LIST_TABLES_RESULT = ['Vehicle', 'Person']
+DEFAULT_CLIENT_KWARGS = {'region_name': None, 'verify': None, 'endpoint_url': None, 'aws_access_key_id': None,
+                         'aws_secret_access_key': None, 'aws_session_token': None}
+EMPTY_CLIENT_KWARGS = {'region_name': EMPTY_STRING, 'verify': EMPTY_STRING, 'endpoint_url': EMPTY_STRING,
+                       'aws_access_key_id': EMPTY_STRING, 'aws_secret_access_key': EMPTY_STRING,
+                       'aws_session_token': EMPTY_STRING}
+MOCK_INVALID_SESSION_ERROR = ClientError({'Error': {'Code': 'InvalidSessionException', 'Message': MOCK_MESSAGE}},
+                                         MOCK_MESSAGE)
+MOCK_RETRYABLE_EXECUTE_ERROR = ExecuteError(Exception(), True, False, DEFAULT_TRANSACTION_ID)
+MOCK_INVALID_SESSION_EXECUTE_ERROR = ExecuteError(Exception(), True, True)
+MOCK_NON_RETRYABLE_EXECUTE_ERROR = ExecuteError(Exception(), False, False)
+
+
+def _self_returning_mock():
+    """
+    Build a Mock that returns itself when called, so a patched constructor hands back the mock being asserted on.
+    """
+    mock = Mock()
+    mock.return_value = mock
+    return mock
+
+
+class _FakeQueue:
+    """
+    Lock-free stand-in for the driver's session pool Queue.
+    """
+    def __init__(self):
+        self._items = deque()
+
+    def put(self, item):
+        self._items.append(item)
+
+    def get_nowait(self):
+        if not self._items:
+            raise Empty
+        return self._items.popleft()
+
+    def qsize(self):
+        return len(self._items)
+
+
+class _FakeSemaphore:
+    """
+    Stand-in for the driver's BoundedSemaphore that records each call instead of blocking.
+    """
+    def __init__(self, acquire_result=True):
+        self.acquire_result = acquire_result
+        self.calls = []
+
+    def acquire(self, timeout=None):
+        self.calls.append(('acquire', timeout))
+        return self.acquire_result
+
+    def release(self):
+        self.calls.append(('release',))
+
+
+class _FakeAtomicInteger:
+    """
+    Stand-in for the driver's AtomicInteger that records each update.
+    """
+    def __init__(self, value=DEFAULT_MAX_CONCURRENT_TRANSACTIONS):
+        self.value = value
+        self.calls = []
+
+    def increment(self):
+        self.calls.append('increment')
+        self.value += 1
+        return self.value
+
+    def decrement(self):
+        self.calls.append('decrement')
+        self.value -= 1
+        return self.value
 
 
 class TestQldbDriver(TestCase):
-    @patch('pyqldb.driver.qldb_driver.Queue')
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_valid_config(self, mock_client, mock_bounded_semaphore,
-                                           mock_atomic_integer, mock_queue):
-        mock_queue.return_value = mock_queue
-        mock_atomic_integer.return_value = mock_atomic_integer
-        mock_bounded_semaphore.return_value = mock_bounded_semaphore
-        mock_client.return_value = mock_client
-
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, config=MOCK_CONFIG)
-
-        mock_client.assert_called_once_with(DEFAULT_SESSION_NAME, aws_access_key_id=None,
-                                            aws_secret_access_key=None, aws_session_token=None,
-                                            config=MOCK_CONFIG, endpoint_url=None, region_name=None, verify=None)
-        self.assertEqual(qldb_driver._ledger_name, MOCK_LEDGER_NAME)
-        self.assertEqual(qldb_driver.retry_limit, DEFAULT_RETRY_LIMIT)
-        self.assertEqual(qldb_driver._retry_config.base, DEFAULT_BACKOFF_BASE)
-        self.assertEqual(qldb_driver._read_ahead, DEFAULT_READ_AHEAD)
-        self.assertEqual(qldb_driver._pool_permits, mock_bounded_semaphore)
-        self.assertEqual(qldb_driver._pool_permits_counter, mock_atomic_integer)
-        self.assertEqual(qldb_driver._pool, mock_queue)
-        mock_bounded_semaphore.assert_called_once_with(DEFAULT_MAX_CONCURRENT_TRANSACTIONS)
-        mock_atomic_integer.assert_called_once_with(DEFAULT_MAX_CONCURRENT_TRANSACTIONS)
-        mock_queue.assert_called_once_with()
-
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_invalid_config(self, mock_client):
-        mock_client.return_value = mock_client
-
+    @classmethod
+    def setUpClass(cls):
+        with patch.object(qldb_driver_module, 'client', new_callable=Mock):
+            cls._template_driver = QldbDriver(MOCK_LEDGER_NAME)
+
+    def setUp(self):
+        client_patcher = patch.object(qldb_driver_module, 'client', new_callable=_self_returning_mock)
+        self.mock_client = client_patcher.start()
+        self.addCleanup(client_patcher.stop)
+
+    def copy_template_driver(self):
+        """
+        Return a shallow copy of the class-level driver with fresh pool state, for tests that do not exercise the
+        constructor.
+        """
+        driver = copy(self._template_driver)
+        driver._pool = _FakeQueue()
+        driver._pool_permits = _FakeSemaphore()
+        driver._pool_permits_counter = _FakeAtomicInteger()
+        return driver
+
+    def assert_default_pool_wiring(self, qldb_driver, pool_mocks, max_concurrent_transactions):
+        """
+        Assert a freshly constructed driver has default settings and a pool built from the patched constructors.
+        """
+        mock_bounded_semaphore = pool_mocks['BoundedSemaphore']
+        mock_atomic_integer = pool_mocks['AtomicInteger']
+        mock_queue = pool_mocks['Queue']
+        self.assertEqual((qldb_driver._ledger_name, qldb_driver.retry_limit, qldb_driver._retry_config.base,
+                          qldb_driver._read_ahead),
+                         (MOCK_LEDGER_NAME, DEFAULT_RETRY_LIMIT, DEFAULT_BACKOFF_BASE, DEFAULT_READ_AHEAD))
+        self.assertEqual((qldb_driver._pool_permits, qldb_driver._pool_permits_counter, qldb_driver._pool),
+                         (mock_bounded_semaphore, mock_atomic_integer, mock_queue))
+        self.assertEqual(mock_bounded_semaphore.mock_calls, [call(max_concurrent_transactions)])
+        self.assertEqual(mock_atomic_integer.mock_calls, [call(max_concurrent_transactions)])
+        self.assertEqual(mock_queue.mock_calls, [call()])
+
+    @patch.multiple(qldb_driver_module, new_callable=_self_returning_mock, BoundedSemaphore=DEFAULT,
+                    AtomicInteger=DEFAULT, Queue=DEFAULT)
+    def test_constructor_with_valid_config(self, **pool_mocks):
+        config = Config(user_agent_extra=MOCK_USER_AGENT)
+        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, config=config)
+
+        self.mock_client.assert_called_once_with(DEFAULT_SESSION_NAME, config=config, **DEFAULT_CLIENT_KWARGS)
+        self.assert_default_pool_wiring(qldb_driver, pool_mocks, DEFAULT_MAX_CONCURRENT_TRANSACTIONS)
+
+    def test_constructor_with_invalid_config(self):
         self.assertRaises(TypeError, QldbDriver, MOCK_LEDGER_NAME, config=EMPTY_STRING)
-        mock_client.assert_not_called()
-
-    @patch('pyqldb.driver.qldb_driver.Queue')
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_default_constructor_with_parameters(self, mock_client, mock_bounded_semaphore, mock_atomic_integer,
-                                                 mock_queue):
-        mock_queue.return_value = mock_queue
-        mock_atomic_integer.return_value = mock_atomic_integer
-        mock_bounded_semaphore.return_value = mock_bounded_semaphore
-        mock_client.return_value = mock_client
-
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, region_name=EMPTY_STRING, verify=EMPTY_STRING,
-                                 endpoint_url=EMPTY_STRING, aws_access_key_id=EMPTY_STRING,
-                                 aws_secret_access_key=EMPTY_STRING, aws_session_token=EMPTY_STRING,
-                                 config=MOCK_CONFIG)
-
-        mock_client.assert_called_once_with(DEFAULT_SESSION_NAME, region_name=EMPTY_STRING, verify=EMPTY_STRING,
-                                            endpoint_url=EMPTY_STRING, aws_access_key_id=EMPTY_STRING,
-                                            aws_secret_access_key=EMPTY_STRING, aws_session_token=EMPTY_STRING,
-                                            config=MOCK_CONFIG)
-        self.assertEqual(qldb_driver._ledger_name, MOCK_LEDGER_NAME)
-        self.assertEqual(qldb_driver.retry_limit, DEFAULT_RETRY_LIMIT)
-        self.assertEqual(qldb_driver._retry_config.base, DEFAULT_BACKOFF_BASE)
-        self.assertEqual(qldb_driver._read_ahead, DEFAULT_READ_AHEAD)
-        self.assertEqual(qldb_driver._pool_permits, mock_bounded_semaphore)
-        self.assertEqual(qldb_driver._pool_permits_counter, mock_atomic_integer)
-        self.assertEqual(qldb_driver._pool, mock_queue)
-        mock_bounded_semaphore.assert_called_once_with(DEFAULT_MAX_CONCURRENT_TRANSACTIONS)
-        mock_atomic_integer.assert_called_once_with(DEFAULT_MAX_CONCURRENT_TRANSACTIONS)
-        mock_queue.assert_called_once_with()
+        self.mock_client.assert_not_called()
+
+    @patch.multiple(qldb_driver_module, new_callable=_self_returning_mock, BoundedSemaphore=DEFAULT,
+                    AtomicInteger=DEFAULT, Queue=DEFAULT)
+    def test_default_constructor_with_parameters(self, **pool_mocks):
+        config = Config(user_agent_extra=MOCK_USER_AGENT)
+        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, config=config, **EMPTY_CLIENT_KWARGS)
+
+        self.mock_client.assert_called_once_with(DEFAULT_SESSION_NAME, config=config, **EMPTY_CLIENT_KWARGS)
+        self.assert_default_pool_wiring(qldb_driver, pool_mocks, DEFAULT_MAX_CONCURRENT_TRANSACTIONS)
 
     def test_constructor_with_boto3_session(self):
-        mock_session = Mock(spec=MOCK_BOTO3_SESSION)
+        mock_session = Mock(spec=Session)
+        config = Config(user_agent_extra=MOCK_USER_AGENT)
 
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, boto3_session=mock_session, config=MOCK_CONFIG)
-        mock_session.client.assert_called_once_with(DEFAULT_SESSION_NAME, config=MOCK_CONFIG, endpoint_url=None,
+        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, boto3_session=mock_session, config=config)
+        mock_session.client.assert_called_once_with(DEFAULT_SESSION_NAME, config=config, endpoint_url=None,
                                                     verify=None)
         self.assertEqual(qldb_driver._client, mock_session.client())
-        self.assertTrue(SERVICE_DESCRIPTION in qldb_driver._config.user_agent_extra)
+        self.assertEqual(qldb_driver._config.user_agent_extra, ' '.join([SERVICE_DESCRIPTION, MOCK_USER_AGENT]))
 
-    @patch('pyqldb.driver.qldb_driver.logger.warning')
+    @patch.object(qldb_driver_module.logger, 'warning', new_callable=Mock)
     def test_constructor_with_boto3_session_and_parameters_that_may_overwrite(self, mock_logger_warning):
-        mock_session = Mock(spec=MOCK_BOTO3_SESSION)
+        mock_session = Mock(spec=Session)
+        config = Config(user_agent_extra=MOCK_USER_AGENT)
         region_name = 'region_name'
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, boto3_session=mock_session, config=MOCK_CONFIG,
+        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, boto3_session=mock_session, config=config,
                                  region_name=region_name)
-        mock_session.client.assert_called_once_with(DEFAULT_SESSION_NAME, config=MOCK_CONFIG, endpoint_url=None,
+        mock_session.client.assert_called_once_with(DEFAULT_SESSION_NAME, config=config, endpoint_url=None,
                                                     verify=None)
         self.assertEqual(qldb_driver._client, mock_session.client())
         mock_logger_warning.assert_called_once()
@@ -127,134 +200,58 @@ class TestQldbDriver(TestCase):
 
         self.assertRaises(TypeError, QldbDriver, MOCK_LEDGER_NAME, botocore_session=mock_session)
 
-    @patch('pyqldb.driver.qldb_driver.Queue')
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_max_concurrent_transactions_0(self, mock_client, mock_bounded_semaphore,
-                                                            mock_atomic_integer,
-                                                            mock_queue):
-        mock_queue.return_value = mock_queue
-        mock_atomic_integer.return_value = mock_atomic_integer
-        mock_bounded_semaphore.return_value = mock_bounded_semaphore
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
-        self.assertEqual(qldb_driver._ledger_name, MOCK_LEDGER_NAME)
-        self.assertEqual(qldb_driver.retry_limit, DEFAULT_RETRY_LIMIT)
-        self.assertEqual(qldb_driver._retry_config.base, DEFAULT_BACKOFF_BASE)
-        self.assertEqual(qldb_driver._read_ahead, DEFAULT_READ_AHEAD)
-        self.assertEqual(qldb_driver._pool_permits, mock_bounded_semaphore)
-        self.assertEqual(qldb_driver._pool_permits_counter, mock_atomic_integer)
-        self.assertEqual(qldb_driver._pool, mock_queue)
-        mock_bounded_semaphore.assert_called_once_with(DEFAULT_MAX_CONCURRENT_TRANSACTIONS)
-        mock_atomic_integer.assert_called_once_with(DEFAULT_MAX_CONCURRENT_TRANSACTIONS)
-        mock_queue.assert_called_once_with()
-
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_negative_max_concurrent_transactions(self, mock_client):
-        mock_client.return_value = mock_client
-        self.assertRaises(ValueError, QldbDriver, MOCK_LEDGER_NAME, max_concurrent_transactions=-1)
-
-    @patch('pyqldb.driver.qldb_driver.Queue')
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_max_concurrent_transactions_less_than_client_max_concurrent_transactions(self,
-                                                                                                       mock_client,
-                                                                                                       mock_bounded_semaphore,
-                                                                                                       mock_atomic_integer,
-                                                                                                       mock_queue):
-        mock_queue.return_value = mock_queue
-        mock_atomic_integer.return_value = mock_atomic_integer
-        mock_bounded_semaphore.return_value = mock_bounded_semaphore
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        new_max_concurrent_transactions = DEFAULT_MAX_CONCURRENT_TRANSACTIONS - 1
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME, max_concurrent_transactions=new_max_concurrent_transactions)
-
-        self.assertEqual(qldb_driver._ledger_name, MOCK_LEDGER_NAME)
-        self.assertEqual(qldb_driver.retry_limit, DEFAULT_RETRY_LIMIT)
-        self.assertEqual(qldb_driver._retry_config.base, DEFAULT_BACKOFF_BASE)
-        self.assertEqual(qldb_driver._read_ahead, DEFAULT_READ_AHEAD)
-        self.assertEqual(qldb_driver._pool_permits, mock_bounded_semaphore)
-        self.assertEqual(qldb_driver._pool_permits_counter, mock_atomic_integer)
-        self.assertEqual(qldb_driver._pool, mock_queue)
-        mock_bounded_semaphore.assert_called_once_with(new_max_concurrent_transactions)
-        mock_atomic_integer.assert_called_once_with(new_max_concurrent_transactions)
-        mock_queue.assert_called_once_with()
-
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_max_concurrent_transactions_greater_than_client_max_concurrent_transactions(self,
-                                                                                                          mock_client):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        new_max_concurrent_transactions = DEFAULT_MAX_CONCURRENT_TRANSACTIONS + 1
-        self.assertRaises(ValueError, QldbDriver, MOCK_LEDGER_NAME,
-                          max_concurrent_transactions=new_max_concurrent_transactions)
-
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_default_timeout(self, mock_client):
-        mock_client.return_value = mock_client
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
+    @patch.multiple(qldb_driver_module, new_callable=_self_returning_mock, BoundedSemaphore=DEFAULT,
+                    AtomicInteger=DEFAULT, Queue=DEFAULT)
+    def test_constructor_with_max_concurrent_transactions(self, **pool_mocks):
+        cases = ((0, DEFAULT_MAX_CONCURRENT_TRANSACTIONS),
+                 (DEFAULT_MAX_CONCURRENT_TRANSACTIONS - 1, DEFAULT_MAX_CONCURRENT_TRANSACTIONS - 1))
+        for max_concurrent_transactions, expected_pool_limit in cases:
+            with self.subTest(max_concurrent_transactions=max_concurrent_transactions):
+                for mock in pool_mocks.values():
+                    mock.reset_mock()
+                qldb_driver = QldbDriver(MOCK_LEDGER_NAME, max_concurrent_transactions=max_concurrent_transactions)
+
+                self.assert_default_pool_wiring(qldb_driver, pool_mocks, expected_pool_limit)
+
+    def test_constructor_with_default_timeout(self):
+        qldb_driver = self.copy_template_driver()
         self.assertEqual(qldb_driver._timeout, DEFAULT_TIMEOUT_SECONDS)
 
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_read_ahead_0(self, mock_client):
-        mock_client.return_value = mock_client
-        driver = QldbDriver(MOCK_LEDGER_NAME, read_ahead=0)
-
-        self.assertEqual(driver._read_ahead, 0)
-
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_read_ahead_1(self, mock_client):
-        mock_client.return_value = mock_client
-        self.assertRaises(ValueError, QldbDriver, MOCK_LEDGER_NAME, read_ahead=1)
-
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_constructor_with_read_ahead_2(self, mock_client):
-        mock_client.return_value = mock_client
-        driver = QldbDriver(MOCK_LEDGER_NAME, read_ahead=2)
-        self.assertEqual(driver._read_ahead, 2)
-
-    @patch('pyqldb.driver.qldb_driver.QldbDriver.close')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_context_manager(self, mock_client, mock_close):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-
-        with QldbDriver(MOCK_LEDGER_NAME):
+    def test_constructor_with_valid_read_ahead(self):
+        for read_ahead in (0, 2):
+            with self.subTest(read_ahead=read_ahead):
+                driver = QldbDriver(MOCK_LEDGER_NAME, read_ahead=read_ahead)
+                self.assertEqual(driver._read_ahead, read_ahead)
+
+    def test_constructor_with_invalid_parameters(self):
+        for kwargs in ({'read_ahead': 1},
+                       {'max_concurrent_transactions': -1},
+                       {'max_concurrent_transactions': DEFAULT_MAX_CONCURRENT_TRANSACTIONS + 1}):
+            with self.subTest(**kwargs):
+                self.assertRaises(ValueError, QldbDriver, MOCK_LEDGER_NAME, **kwargs)
+
+    @patch.object(QldbDriver, 'close', new_callable=Mock)
+    def test_context_manager(self, mock_close):
+        with self.copy_template_driver():
             pass
 
         mock_close.assert_called_once_with()
 
-    @patch('pyqldb.driver.qldb_driver.SessionClient')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver.close')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_context_manager_with_invalid_session_error(self, mock_client, mock_close, mock_session_client):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-
-        mock_invalid_session_error_message = {'Error': {'Code': 'InvalidSessionException',
-                                                        'Message': MOCK_MESSAGE}}
-        mock_invalid_session_error = ClientError(mock_invalid_session_error_message, MOCK_MESSAGE)
-        mock_session_client._start_session.side_effect = mock_invalid_session_error
+    @patch.object(qldb_driver_module, 'SessionClient', new_callable=Mock)
+    @patch.object(QldbDriver, 'close', new_callable=Mock)
+    def test_context_manager_with_invalid_session_error(self, mock_close, mock_session_client):
+        mock_session_client._start_session.side_effect = MOCK_INVALID_SESSION_ERROR
 
         with self.assertRaises(ClientError):
-            with QldbDriver(MOCK_LEDGER_NAME) as qldb_driver:
+            with self.copy_template_driver() as qldb_driver:
                 qldb_driver._create_new_session()
 
         mock_close.assert_called_once_with()
 
-    @patch('pyqldb.session.qldb_session.QldbSession')
-    @patch('pyqldb.session.qldb_session.QldbSession')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_close(self, mock_client, mock_qldb_session1, mock_qldb_session2):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
-        qldb_driver._pool = Queue()
+    def test_close(self):
+        mock_qldb_session1 = Mock(spec_set=QldbSession)
+        mock_qldb_session2 = Mock(spec_set=QldbSession)
+        qldb_driver = self.copy_template_driver()
         qldb_driver._pool.put(mock_qldb_session1)
         qldb_driver._pool.put(mock_qldb_session2)
 
@@ -262,113 +259,79 @@ class TestQldbDriver(TestCase):
         mock_qldb_session1._end_session.assert_called_once_with()
         mock_qldb_session2._end_session.assert_called_once_with()
 
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._create_new_session')
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.QldbSession')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_get_session_new_session(self, mock_client, mock_qldb_session, mock_bounded_semaphore, mock_atomic_integer,
-                                     mock_create_new_session):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        mock_create_new_session.return_value = mock_qldb_session
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
+    def test_get_session_new_session(self):
+        mock_qldb_session = Mock(spec=QldbSession)
+        qldb_driver = self.copy_template_driver()
+        mock_create_new_session = qldb_driver._create_new_session = Mock(return_value=mock_qldb_session)
 
         session = qldb_driver._get_session(True)
 
-        mock_bounded_semaphore().acquire.assert_called_once_with(timeout=DEFAULT_TIMEOUT_SECONDS)
-        mock_atomic_integer().decrement.assert_called_once_with()
+        self.assertEqual(qldb_driver._pool_permits.calls, [('acquire', DEFAULT_TIMEOUT_SECONDS)])
+        self.assertEqual(qldb_driver._pool_permits_counter.calls, ['decrement'])
         mock_create_new_session.assert_called_once_with()
         self.assertEqual(session, mock_qldb_session)
 
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._create_new_session')
-    @patch('pyqldb.driver.qldb_driver.logger.debug')
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.QldbSession')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_get_session_existing_session(self, mock_client, mock_qldb_session, mock_bounded_semaphore,
-                                          mock_atomic_integer, mock_logger_debug, mock_create_new_session):
-        mock_qldb_session.return_value = mock_qldb_session
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
-        qldb_driver._pool = Queue()
+    @patch.object(qldb_driver_module.logger, 'debug', new_callable=Mock)
+    def test_get_session_existing_session(self, mock_logger_debug):
+        mock_qldb_session = Mock(spec=QldbSession)
+        qldb_driver = self.copy_template_driver()
+        mock_create_new_session = qldb_driver._create_new_session = Mock()
         qldb_driver._pool.put(mock_qldb_session)
 
         session = qldb_driver._get_session(False)
 
         self.assertEqual(session, mock_qldb_session)
-        mock_bounded_semaphore().acquire.assert_called_once_with(timeout=DEFAULT_TIMEOUT_SECONDS)
-        mock_atomic_integer().decrement.assert_called_once_with()
+        self.assertEqual(qldb_driver._pool_permits.calls, [('acquire', DEFAULT_TIMEOUT_SECONDS)])
+        self.assertEqual(qldb_driver._pool_permits_counter.calls, ['decrement'])
         self.assertEqual(mock_logger_debug.call_count, 2)
         mock_create_new_session.assert_not_called()
 
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._create_new_session')
-    @patch('pyqldb.driver.qldb_driver.logger.debug')
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.QldbSession')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_get_session_no_session_in_pool(self, mock_client, mock_qldb_session, mock_bounded_semaphore,
-                                            mock_atomic_integer, mock_logger_debug, mock_create_new_session):
-        mock_create_new_session.return_value = mock_qldb_session
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
-        qldb_driver._pool = Queue()
+    @patch.object(qldb_driver_module.logger, 'debug', new_callable=Mock)
+    def test_get_session_no_session_in_pool(self, mock_logger_debug):
+        mock_qldb_session = Mock(spec=QldbSession)
+        qldb_driver = self.copy_template_driver()
+        mock_create_new_session = qldb_driver._create_new_session = Mock(return_value=mock_qldb_session)
 
         session = qldb_driver._get_session(False)
 
         self.assertEqual(session, mock_qldb_session)
-        mock_bounded_semaphore().acquire.assert_called_once_with(timeout=DEFAULT_TIMEOUT_SECONDS)
-        mock_atomic_integer().decrement.assert_called_once_with()
+        self.assertEqual(qldb_driver._pool_permits.calls, [('acquire', DEFAULT_TIMEOUT_SECONDS)])
+        self.assertEqual(qldb_driver._pool_permits_counter.calls, ['decrement'])
         self.assertEqual(mock_logger_debug.call_count, 2)
         mock_create_new_session.assert_called_once_with()
 
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._create_new_session')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_get_session_exception(self, mock_client, mock_create_new_session, mock_bounded_semaphore, mock_atomic_integer):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
+    def test_get_session_exception(self):
         error = KeyError()
-        mock_create_new_session.side_effect = error
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
+        qldb_driver = self.copy_template_driver()
+        qldb_driver._create_new_session = Mock(side_effect=error)
 
         with self.assertRaises(ExecuteError) as cm:
             qldb_driver._get_session(False)
 
         assert_execute_error(self, cm.exception, error, True, True, None)
-        mock_bounded_semaphore().release.assert_called_once_with()
-        mock_atomic_integer().increment.assert_called_once_with()
-
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.logger.debug')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_get_session_session_pool_empty_error(self, mock_client, mock_bounded_semaphore, mock_logger_debug,
-                                                  mock_atomic_integer):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        mock_bounded_semaphore().acquire.return_value = False
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
-
-        self.assertRaises(SessionPoolEmptyError, qldb_driver._get_session, True)
-        mock_logger_debug.assert_called_once()
-        mock_bounded_semaphore().release.assert_not_called()
-        mock_atomic_integer().increment.assert_not_called()
-
-    @patch('pyqldb.driver.qldb_driver.QldbSession')
-    @patch('pyqldb.communication.session_client.SessionClient._start_session')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_create_new_session(self, mock_client, mock_session_start_session, mock_qldb_session):
+        self.assertEqual(qldb_driver._pool_permits.calls, [('acquire', DEFAULT_TIMEOUT_SECONDS), ('release',)])
+        self.assertEqual(qldb_driver._pool_permits_counter.calls, ['decrement', 'increment'])
+
+    @patch.object(qldb_driver_module.logger, 'debug', new_callable=Mock)
+    def test_get_session_session_pool_empty_error(self, mock_logger_debug):
+        for timeout in (DEFAULT_TIMEOUT_SECONDS, 20):
+            with self.subTest(timeout=timeout):
+                mock_logger_debug.reset_mock()
+                qldb_driver = self.copy_template_driver()
+                qldb_driver._timeout = timeout
+                qldb_driver._pool_permits.acquire_result = False
+
+                self.assertRaises(SessionPoolEmptyError, qldb_driver._get_session, True)
+                mock_logger_debug.assert_called_once()
+                self.assertEqual(qldb_driver._pool_permits.calls, [('acquire', timeout)])
+                self.assertEqual(qldb_driver._pool_permits_counter.calls, [])
+
+    @patch.object(qldb_driver_module, 'QldbSession', new_callable=Mock)
+    @patch.object(session_client_module.SessionClient, '_start_session', new_callable=Mock)
+    def test_create_new_session(self, mock_session_start_session, mock_qldb_session):
         mock_session_start_session.return_value = mock_session_start_session
         mock_qldb_session.return_value = mock_qldb_session
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
+        qldb_driver = self.copy_template_driver()
         session = qldb_driver._create_new_session()
 
         mock_session_start_session.assert_called_once_with(MOCK_LEDGER_NAME, qldb_driver._client)
@@ -376,232 +339,160 @@ class TestQldbDriver(TestCase):
                                                   qldb_driver._executor)
         self.assertEqual(session, mock_qldb_session)
 
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.Queue')
-    @patch('pyqldb.session.qldb_session.QldbSession')
-    @patch('pyqldb.driver.qldb_driver.logger.debug')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_release_session_for_active_session(self, mock_client, mock_logger_debug, mock_qldb_session, mock_queue,
-                                                mock_bounded_semaphore, mock_atomic_integer):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
-        mock_qldb_session._is_alive = True
-        self.assertTrue(qldb_driver._release_session(mock_qldb_session))
-
-        mock_queue().put.assert_called_once_with(mock_qldb_session)
-        mock_bounded_semaphore().release.assert_called_once_with()
-        mock_atomic_integer().increment.assert_called_once_with()
-        mock_logger_debug.assert_called_once()
-
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.Queue')
-    @patch('pyqldb.session.qldb_session.QldbSession')
-    @patch('pyqldb.driver.qldb_driver.logger.debug')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_release_session_for_closed_session(self, mock_client, mock_logger_debug, mock_qldb_session, mock_queue,
-                                                mock_bounded_semaphore, mock_atomic_integer):
-        mock_client.return_value = mock_client
-        mock_client.max_pool_connections = DEFAULT_MAX_CONCURRENT_TRANSACTIONS
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
-        mock_qldb_session._is_alive = False
-        self.assertFalse(qldb_driver._release_session(mock_qldb_session))
-
-        mock_queue().put.assert_not_called()
-        mock_bounded_semaphore().release.assert_called_once_with()
-        mock_atomic_integer().increment.assert_called_once_with()
-        mock_logger_debug.assert_not_called()
-
-    @patch('pyqldb.driver.qldb_driver.AtomicInteger')
-    @patch('pyqldb.driver.qldb_driver.BoundedSemaphore')
-    @patch('pyqldb.driver.qldb_driver.Queue')
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_release_session_for_none_session(self, mock_client, mock_queue, mock_bounded_semaphore,
-                                              mock_atomic_integer):
-        mock_client.return_value = mock_client
-        qldb_driver = QldbDriver(MOCK_LEDGER_NAME)
-        self.assertFalse(qldb_driver._release_session(None))
-        mock_queue.put.assert_not_called()
-        mock_bounded_semaphore().release.assert_not_called()
-        mock_atomic_integer().increment.assert_not_called()
-
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_get_read_ahead(self, mock_client):
-        mock_client.return_value = mock_client
-        driver = QldbDriver(MOCK_LEDGER_NAME)
+    @patch.object(qldb_driver_module.logger, 'debug', new_callable=Mock)
+    def test_release_session(self, mock_logger_debug):
+        active_session = Mock(spec=QldbSession)
+        active_session._is_alive = True
+        closed_session = Mock(spec=QldbSession)
+        closed_session._is_alive = False
+
+        for state, session, is_pooled in (('active', active_session, True), ('closed', closed_session, False),
+                                          ('none', None, False)):
+            with self.subTest(session=state):
+                mock_logger_debug.reset_mock()
+                qldb_driver = self.copy_template_driver()
+
+                self.assertEqual(qldb_driver._release_session(session), is_pooled)
+
+                pooled_sessions = [qldb_driver._pool.get_nowait() for _ in range(qldb_driver._pool.qsize())]
+                self.assertEqual(pooled_sessions, [session] if is_pooled else [])
+                self.assertEqual(qldb_driver._pool_permits.calls, [('release',)] if session else [])
+                self.assertEqual(qldb_driver._pool_permits_counter.calls, ['increment'] if session else [])
+                self.assertEqual(mock_logger_debug.call_count, 1 if is_pooled else 0)
+
+    def test_get_read_ahead(self):
+        driver = self.copy_template_driver()
         self.assertEqual(driver.read_ahead, driver._read_ahead)
 
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_get_retry_limit(self, mock_client):
-        mock_client.return_value = mock_client
+    def test_get_retry_limit(self):
         retry_limit = 4
         retry_config = RetryConfig(retry_limit=retry_limit)
         driver = QldbDriver(MOCK_LEDGER_NAME, retry_config=retry_config)
         self.assertEqual(driver.retry_limit, retry_limit)
 
-    @patch('pyqldb.driver.qldb_driver.client')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver.execute_lambda')
-    def test_list_tables(self, mock_execute_lambda, mock_client):
-        mock_client.return_value = mock_client
+    @patch.object(QldbDriver, 'execute_lambda', new_callable=Mock)
+    def test_list_tables(self, mock_execute_lambda):
         mock_execute_lambda.return_value = MOCK_LIST_TABLES_RESULT
 
-        driver = QldbDriver(MOCK_LEDGER_NAME)
+        driver = self.copy_template_driver()
         table_names = driver.list_tables()
 
-        count = 0
-        for result in table_names:
-            self.assertEqual(result, MOCK_LIST_TABLES_RESULT[count])
-            count += 1
-
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._release_session')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.driver.qldb_driver.client')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._get_session')
-    def test_execute_lambda(self, mock_get_session, mock_client, mock_session, mock_release_session):
-        mock_client.return_value = mock_client
-        mock_lambda = Mock()
+        self.assertEqual(list(table_names), MOCK_LIST_TABLES_RESULT)
+
+    @patch.object(QldbDriver, '_release_session', new_callable=Mock)
+    @patch.object(QldbDriver, '_get_session', new_callable=Mock)
+    def test_execute_lambda(self, mock_get_session, mock_release_session):
+        mock_session = Mock(spec=QldbSession)
         mock_get_session.return_value = mock_session
         mock_session._execute_lambda.return_value = MOCK_MESSAGE
 
-        driver = QldbDriver(MOCK_LEDGER_NAME)
-        result = driver.execute_lambda(mock_lambda)
+        driver = self.copy_template_driver()
+        result = driver.execute_lambda(sentinel.query_lambda)
 
         mock_release_session.assert_called_once_with(mock_session)
         mock_get_session.assert_called_once_with(False)
-        mock_session._execute_lambda.assert_called_once_with(mock_lambda)
+        mock_session._execute_lambda.assert_called_once_with(sentinel.query_lambda)
         self.assertEqual(result, MOCK_MESSAGE)
 
-    @patch('pyqldb.driver.qldb_driver.client')
-    def test_execute_lambda_when_driver_is_closed(self, mock_client):
-        mock_client.return_value = mock_client
-        mock_lambda = Mock()
-
-        driver = QldbDriver(MOCK_LEDGER_NAME)
+    def test_execute_lambda_when_driver_is_closed(self):
+        driver = self.copy_template_driver()
         driver._is_closed = True
-        self.assertRaises(DriverClosedError, driver.execute_lambda, mock_lambda)
-
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._release_session')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.driver.qldb_driver.client')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._get_session')
-    def test_execute_lambda_non_execute_error(self, mock_get_session, mock_client, mock_session, mock_release_session):
-        mock_client.return_value = mock_client
-        mock_lambda = Mock()
-        mock_get_session.return_value = mock_session
-
-        error = Exception()
-        mock_session._execute_lambda.side_effect = error
-        driver = QldbDriver(MOCK_LEDGER_NAME)
-
-        self.assertRaises(Exception, driver.execute_lambda, mock_lambda)
-        mock_get_session.assert_called_once_with(False)
-        mock_release_session.assert_called_once_with(mock_session)
+        self.assertRaises(DriverClosedError, driver.execute_lambda, sentinel.query_lambda)
 
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._release_session')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.driver.qldb_driver.client')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._get_session')
-    def test_execute_lambda_non_retryable_execute_error(self, mock_get_session, mock_client, mock_session, mock_release_session):
-        mock_client.return_value = mock_client
-        mock_lambda = Mock()
+    @patch.object(QldbDriver, '_release_session', new_callable=Mock)
+    @patch.object(QldbDriver, '_get_session', new_callable=Mock)
+    def test_execute_lambda_non_retryable_error(self, mock_get_session, mock_release_session):
+        mock_session = Mock(spec=QldbSession)
         mock_get_session.return_value = mock_session
-        executeError = ExecuteError(Exception(), False, False)
-        mock_session._execute_lambda.side_effect = executeError
-
-        driver = QldbDriver(MOCK_LEDGER_NAME)
-
-        self.assertRaises(Exception, driver.execute_lambda, mock_lambda)
-        mock_get_session.assert_called_once_with(False)
-        mock_release_session.assert_called_once_with(mock_session)
-
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._release_session')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._retry_sleep')
-    @patch('pyqldb.driver.qldb_driver.client')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._get_session')
-    def test_execute_lambda_retryable_error_and_under_retry_limit(self, mock_get_session, mock_client, mock_retry_sleep,
-                                                                  mock_session, mock_release_session):
-        mock_client.return_value = mock_client
-        mock_lambda = Mock()
+        driver = self.copy_template_driver()
+
+        for error in (Exception(), MOCK_NON_RETRYABLE_EXECUTE_ERROR):
+            with self.subTest(error=type(error).__name__):
+                mock_get_session.reset_mock()
+                mock_release_session.reset_mock()
+                mock_session._execute_lambda.side_effect = error
+
+                self.assertRaises(Exception, driver.execute_lambda, sentinel.query_lambda)
+                mock_get_session.assert_called_once_with(False)
+                mock_release_session.assert_called_once_with(mock_session)
+
+    @patch.object(QldbDriver, '_release_session', new_callable=Mock)
+    @patch.object(QldbDriver, '_retry_sleep', new_callable=Mock)
+    @patch.object(QldbDriver, '_get_session', new_callable=Mock)
+    def test_execute_lambda_retryable_error_and_under_retry_limit(self, mock_get_session, mock_retry_sleep,
+                                                                  mock_release_session):
+        mock_session = Mock(spec=QldbSession)
         mock_get_session.return_value = mock_session
-        inner_error = Exception()
-        retryable_execute_error = ExecuteError(inner_error, True, False, DEFAULT_TRANSACTION_ID)
-        mock_session._execute_lambda.side_effect = [retryable_execute_error, MOCK_MESSAGE]
+        mock_session._execute_lambda.side_effect = [MOCK_RETRYABLE_EXECUTE_ERROR, MOCK_MESSAGE]
         mock_release_session.return_value = True
-        driver = QldbDriver(MOCK_LEDGER_NAME)
-        result = driver.execute_lambda(mock_lambda)
+        driver = self.copy_template_driver()
+        result = driver.execute_lambda(sentinel.query_lambda)
 
         self.assertEqual(result, MOCK_MESSAGE)
 
-        mock_get_session.assert_has_calls([call(False), call(False)])
+        self.assertEqual(mock_get_session.call_args_list, [call(False), call(False)])
         mock_release_session.assert_has_calls([call(mock_session), call(mock_session)])
-        mock_retry_sleep.assert_called_once_with(driver._retry_config, 1, inner_error, DEFAULT_TRANSACTION_ID)
+        mock_retry_sleep.assert_called_once_with(driver._retry_config, 1, MOCK_RETRYABLE_EXECUTE_ERROR.error,
+                                                 DEFAULT_TRANSACTION_ID)
         self.assertEqual(mock_session._execute_lambda.call_count, 2)
 
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._release_session')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._retry_sleep')
-    @patch('pyqldb.driver.qldb_driver.client')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._get_session')
-    def test_execute_lambda_retryable_error_and_exceed_retry_limit(self, mock_get_session, mock_client, mock_retry_sleep,
-                                                                   mock_session, mock_release_session):
-        mock_client.return_value = mock_client
-        mock_lambda = Mock()
+    @patch.object(QldbDriver, '_release_session', new_callable=Mock)
+    @patch.object(QldbDriver, '_retry_sleep', new_callable=Mock)
+    @patch.object(QldbDriver, '_get_session', new_callable=Mock)
+    def test_execute_lambda_retryable_error_and_exceed_retry_limit(self, mock_get_session, mock_retry_sleep,
+                                                                   mock_release_session):
+        mock_session = Mock(spec=QldbSession)
         mock_get_session.return_value = mock_session
-        inner_error = Exception()
-        retryable_execute_error = ExecuteError(inner_error, True, False, DEFAULT_TRANSACTION_ID)
-        mock_session._execute_lambda.side_effect = [retryable_execute_error, retryable_execute_error, retryable_execute_error]
+        mock_session._execute_lambda.side_effect = [MOCK_RETRYABLE_EXECUTE_ERROR] * 3
         mock_release_session.return_value = True
 
         retryConfig = RetryConfig(retry_limit=2)
-        driver = QldbDriver(MOCK_LEDGER_NAME, retry_config=retryConfig)
+        driver = self.copy_template_driver()
+        driver._retry_config = retryConfig
 
-        self.assertRaises(Exception, driver.execute_lambda, mock_lambda)
-        mock_get_session.assert_has_calls([call(False), call(False), call(False)])
+        self.assertRaises(Exception, driver.execute_lambda, sentinel.query_lambda)
+        self.assertEqual(mock_get_session.call_args_list, [call(False), call(False), call(False)])
         mock_release_session.assert_has_calls([call(mock_session), call(mock_session), call(mock_session)])
+        inner_error = MOCK_RETRYABLE_EXECUTE_ERROR.error
         mock_retry_sleep.assert_has_calls([call(driver._retry_config, 1, inner_error, DEFAULT_TRANSACTION_ID),
                                            call(driver._retry_config, 2, inner_error, DEFAULT_TRANSACTION_ID)])
         self.assertEqual(mock_session._execute_lambda.call_count, 3)
 
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._release_session')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._retry_sleep')
-    @patch('pyqldb.driver.qldb_driver.client')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._get_session')
-    def test_execute_lambda_invalid_session_exception_and_0_retry_limit(self, mock_get_session, mock_client,
-                                                                        mock_retry_sleep, mock_session, mock_release_session):
-        mock_client.return_value = mock_client
-        mock_lambda = Mock()
+    @patch.object(QldbDriver, '_release_session', new_callable=Mock)
+    @patch.object(QldbDriver, '_retry_sleep', new_callable=Mock)
+    @patch.object(QldbDriver, '_get_session', new_callable=Mock)
+    def test_execute_lambda_invalid_session_exception_and_0_retry_limit(self, mock_get_session, mock_retry_sleep,
+                                                                        mock_release_session):
+        mock_session = Mock(spec=QldbSession)
         mock_get_session.return_value = mock_session
-        invalid_session_exception = ExecuteError(Exception(), True, True)
-        mock_session._execute_lambda.side_effect = [invalid_session_exception, MOCK_MESSAGE]
+        mock_session._execute_lambda.side_effect = [MOCK_INVALID_SESSION_EXECUTE_ERROR, MOCK_MESSAGE]
         mock_release_session.return_value = True
 
         retryConfig = RetryConfig(retry_limit=0)
-        driver = QldbDriver(MOCK_LEDGER_NAME, retry_config=retryConfig)
-        result = driver.execute_lambda(mock_lambda)
+        driver = self.copy_template_driver()
+        driver._retry_config = retryConfig
+        result = driver.execute_lambda(sentinel.query_lambda)
 
         self.assertEqual(result, MOCK_MESSAGE)
-        mock_get_session.assert_has_calls([call(False), call(False)])
+        self.assertEqual(mock_get_session.call_args_list, [call(False), call(False)])
         mock_release_session.assert_has_calls([call(mock_session), call(mock_session)])
         mock_retry_sleep.assert_not_called()
         self.assertEqual(mock_session._execute_lambda.call_count, 2)
 
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._release_session')
-    @patch('pyqldb.driver.qldb_driver.client')
-    @patch('pyqldb.driver.qldb_driver.QldbDriver._get_session')
-    def test_execute_lambda_retryable_error_and_session_is_none(self, mock_get_session, mock_client, mock_release_session):
-        mock_client.return_value = mock_client
-        mock_lambda = Mock()
-        retryable_exception = ExecuteError(Exception(), True, True)
-        mock_get_session.side_effect = retryable_exception
+    @patch.object(QldbDriver, '_release_session', new_callable=Mock)
+    @patch.object(QldbDriver, '_retry_sleep', new_callable=Mock)
+    @patch.object(QldbDriver, '_get_session', new_callable=Mock)
+    def test_execute_lambda_retryable_error_and_session_is_none(self, mock_get_session, mock_retry_sleep,
+                                                                mock_release_session):
+        mock_get_session.side_effect = MOCK_INVALID_SESSION_EXECUTE_ERROR
         mock_release_session.return_value = False
 
         retryConfig = RetryConfig(retry_limit=2)
-        driver = QldbDriver(MOCK_LEDGER_NAME, retry_config=retryConfig)
+        driver = self.copy_template_driver()
+        driver._retry_config = retryConfig
 
-        self.assertRaises(Exception, driver.execute_lambda, mock_lambda)
+        self.assertRaises(Exception, driver.execute_lambda, sentinel.query_lambda)
         mock_get_session.assert_has_calls([call(False), call(True)])
         mock_release_session.assert_has_calls([call(None)])
+        mock_retry_sleep.assert_called_once_with(driver._retry_config, 2, MOCK_INVALID_SESSION_EXECUTE_ERROR.error,
+                                                 None)
@@ -9,11 +9,13 @@
 # CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch, sentinel
 
 from botocore.exceptions import ClientError
-from pyqldb.config.retry_config import RetryConfig
+from pyqldb.communication.session_client import SessionClient
+from pyqldb.cursor.stream_cursor import StreamCursor
 from pyqldb.errors import ExecuteError
+from pyqldb.session import qldb_session as qldb_session_module
 from pyqldb.session.qldb_session import QldbSession
 
 from .helper_functions import assert_execute_error
@@ -23,180 +25,134 @@ MOCK_ID = 'mock_id'
 MOCK_LEDGER_NAME = 'QLDB'
 MOCK_MESSAGE = 'foo'
 MOCK_RESULT = {'StartSession': {'SessionToken': 'token'}}
-MOCK_RETRY_LIMIT = 4
 MOCK_READ_AHEAD = 0
-MOCK_SLEEP_CAP_MS = 5000
-MOCK_SLEEP_BASE_MS = 10
 MOCK_TRANSACTION_ID = 'transaction_id'
 MOCK_TRANSACTION_RESULT = {'TransactionId': MOCK_TRANSACTION_ID}
 MOCK_CLIENT_ERROR_MESSAGE = {'Error': {'Code': MOCK_ERROR_CODE, 'Message': MOCK_MESSAGE}}
-MOCK_DEFAULT_RETRY_CONFIG = RetryConfig()
-MOCK_RETRY_CONFIG_WITH_1_RETRY = RetryConfig(retry_limit=1)
+MOCK_CLIENT_ERROR = ClientError(MOCK_CLIENT_ERROR_MESSAGE, MOCK_MESSAGE)
+SESSION_CLIENT_SPEC = dir(SessionClient)
 
 
 class TestQldbSession(TestCase):
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_constructor(self, mock_session, mock_executor):
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-
-        self.assertEqual(qldb_session._is_alive, True)
-        self.assertEqual(qldb_session._read_ahead, MOCK_READ_AHEAD)
-        self.assertEqual(qldb_session._session, mock_session)
-        self.assertEqual(qldb_session._executor, mock_executor)
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_get_ledger_name(self, mock_session, mock_executor):
-        mock_session.ledger_name = MOCK_LEDGER_NAME
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-
-        self.assertEqual(qldb_session.ledger_name, MOCK_LEDGER_NAME)
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_get_session_id(self, mock_session, mock_executor):
-        mock_session.id = MOCK_ID
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-
-        self.assertEqual(qldb_session.session_id, MOCK_ID)
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_get_session_token(self, mock_session, mock_executor):
-        mock_session.token = mock_session
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-
-        self.assertEqual(qldb_session.session_token, mock_session)
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_end_session(self, mock_session, mock_executor):
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-        qldb_session._is_alive = True
-        qldb_session._end_session()
-
-        mock_session._close.assert_called_once_with()
-        self.assertFalse(qldb_session._is_alive)
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_end_session_twice(self, mock_session, mock_executor):
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-        qldb_session._is_alive = True
-        qldb_session._end_session()
-        qldb_session._end_session()
-
-        mock_session._close.assert_called_once_with()
-        self.assertFalse(qldb_session._is_alive)
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.isinstance')
-    @patch('pyqldb.session.qldb_session.BufferedCursor')
-    @patch('pyqldb.session.qldb_session.StreamCursor')
-    @patch('pyqldb.session.qldb_session.Transaction')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.session.qldb_session.QldbSession._start_transaction')
-    def test_execute_lambda(self, mock_start_transaction, mock_session, mock_transaction, mock_stream_cursor,
-                            mock_buffered_cursor, mock_is_instance, mock_executor):
+    def setUp(self):
+        patcher = patch.multiple(qldb_session_module, new_callable=Mock, BufferedCursor=DEFAULT, Transaction=DEFAULT,
+                                 is_invalid_session_exception=DEFAULT, is_occ_conflict_exception=DEFAULT,
+                                 is_retriable_exception=DEFAULT, is_transaction_expired_exception=DEFAULT)
+        self.session_mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_session = Mock(spec_set=SESSION_CLIENT_SPEC)
+        self.mock_executor = Mock()
+        self.qldb_session = QldbSession(self.mock_session, MOCK_READ_AHEAD, self.mock_executor)
+
+    def test_constructor(self):
+        self.assertEqual(self.qldb_session._is_alive, True)
+        self.assertEqual(self.qldb_session._read_ahead, MOCK_READ_AHEAD)
+        self.assertEqual(self.qldb_session._session, self.mock_session)
+        self.assertEqual(self.qldb_session._executor, self.mock_executor)
+
+    def test_read_only_properties(self):
+        self.mock_session.ledger_name = MOCK_LEDGER_NAME
+        self.mock_session.id = MOCK_ID
+        self.mock_session.token = sentinel.session_token
+
+        for name, expected in (('ledger_name', MOCK_LEDGER_NAME), ('session_id', MOCK_ID),
+                               ('session_token', sentinel.session_token)):
+            with self.subTest(property=name):
+                self.assertEqual(getattr(self.qldb_session, name), expected)
+
+    def test_end_session(self):
+        self.qldb_session._is_alive = True
+        self.qldb_session._end_session()
+
+        self.mock_session._close.assert_called_once_with()
+        self.assertFalse(self.qldb_session._is_alive)
+
+    def test_end_session_twice(self):
+        self.qldb_session._is_alive = True
+        self.qldb_session._end_session()
+        self.qldb_session._end_session()
+
+        self.mock_session._close.assert_called_once_with()
+        self.assertFalse(self.qldb_session._is_alive)
+
+    def test_execute_lambda(self):
+        mock_transaction = self.session_mocks['Transaction']
+        mock_buffered_cursor = self.session_mocks['BufferedCursor']
+        mock_start_transaction = self.qldb_session._start_transaction = Mock()
         mock_start_transaction.return_value = mock_transaction
-        mock_transaction.execute_lambda.return_value = MOCK_RESULT
         mock_transaction._commit.return_value = None
-        mock_is_instance.return_value = True
-        mock_stream_cursor.return_value = mock_stream_cursor
+        mock_stream_cursor = Mock(spec=StreamCursor)
         mock_buffered_cursor.return_value = MOCK_RESULT
         mock_lambda = Mock()
-        mock_lambda.return_value = MOCK_RESULT
+        mock_lambda.return_value = mock_stream_cursor
 
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-        result = qldb_session._execute_lambda(mock_lambda)
+        result = self.qldb_session._execute_lambda(mock_lambda)
 
         mock_start_transaction.assert_called_once_with()
         mock_lambda.assert_called_once()
         mock_transaction._commit.assert_called_once_with()
         mock_transaction._close_child_cursors.assert_called_once_with()
-        mock_is_instance.assert_called_with(MOCK_RESULT, mock_stream_cursor)
-        mock_buffered_cursor.assert_called_once_with(MOCK_RESULT)
+        mock_buffered_cursor.assert_called_once_with(mock_stream_cursor)
         self.assertEqual(result, MOCK_RESULT)
 
-    @patch('pyqldb.session.qldb_session.QldbSession._no_throw_abort')
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.is_invalid_session_exception')
-    @patch('pyqldb.session.qldb_session.is_occ_conflict_exception')
-    @patch('pyqldb.session.qldb_session.is_retriable_exception')
-    @patch('pyqldb.session.qldb_session.Transaction')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.session.qldb_session.QldbSession._start_transaction')
-    def test_execute_lambda_retryable_exception(self, mock_start_transaction, mock_session, mock_transaction,
-                                                mock_is_retryable_exception, mock_is_occ_conflict_exception,
-                                                mock_is_invalid_session_exception, mock_executor, mock_no_throw_abort):
-        ce = ClientError(MOCK_CLIENT_ERROR_MESSAGE, 'message')
+    def test_execute_lambda_retryable_exception(self):
+        mock_transaction = self.session_mocks['Transaction']
+        mock_is_retryable_exception = self.session_mocks['is_retriable_exception']
+        mock_is_invalid_session_exception = self.session_mocks['is_invalid_session_exception']
+        mock_is_occ_conflict_exception = self.session_mocks['is_occ_conflict_exception']
+        mock_start_transaction = self.qldb_session._start_transaction = Mock()
+        mock_no_throw_abort = self.qldb_session._no_throw_abort = Mock()
         mock_start_transaction.return_value = mock_transaction
         mock_transaction.transaction_id = 'transaction_id'
         mock_is_retryable_exception.return_value = True
         mock_is_invalid_session_exception.return_value = False
         mock_is_occ_conflict_exception.return_value = False
 
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
         mock_lambda = Mock()
-        mock_lambda.side_effect = ce
+        mock_lambda.side_effect = MOCK_CLIENT_ERROR
 
         with self.assertRaises(ExecuteError) as cm:
-            qldb_session._execute_lambda(mock_lambda)
+            self.qldb_session._execute_lambda(mock_lambda)
 
-        assert_execute_error(self, cm.exception, ce, True, False, mock_transaction.transaction_id)
+        assert_execute_error(self, cm.exception, MOCK_CLIENT_ERROR, True, False, mock_transaction.transaction_id)
         mock_no_throw_abort.assert_called_once_with()
-        self.assertTrue(qldb_session._is_alive)
+        self.assertTrue(self.qldb_session._is_alive)
         mock_transaction._commit.assert_not_called()
         mock_transaction._close_child_cursors.assert_called_once_with()
 
-    @patch('pyqldb.session.qldb_session.QldbSession._no_throw_abort')
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.is_transaction_expired_exception')
-    @patch('pyqldb.session.qldb_session.is_invalid_session_exception')
-    @patch('pyqldb.session.qldb_session.is_retriable_exception')
-    @patch('pyqldb.session.qldb_session.Transaction')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.session.qldb_session.QldbSession._start_transaction')
-    def test_execute_lambda_invalid_session_exception(self, mock_start_transaction, mock_session, mock_transaction,
-                                                      mock_is_retryable_exception, mock_is_invalid_session_exception,
-                                                      mock_is_transaction_expired_exception, mock_executor,
-                                                      mock_no_throw_abort):
-        ce = ClientError(MOCK_CLIENT_ERROR_MESSAGE, 'message')
+    def test_execute_lambda_invalid_session_exception(self):
+        mock_transaction = self.session_mocks['Transaction']
+        mock_is_retryable_exception = self.session_mocks['is_retriable_exception']
+        mock_is_invalid_session_exception = self.session_mocks['is_invalid_session_exception']
+        mock_is_transaction_expired_exception = self.session_mocks['is_transaction_expired_exception']
+        mock_start_transaction = self.qldb_session._start_transaction = Mock()
+        mock_no_throw_abort = self.qldb_session._no_throw_abort = Mock()
         mock_start_transaction.return_value = mock_transaction
         mock_transaction.transaction_id = 'transaction_id'
         mock_is_retryable_exception.return_value = False
         mock_is_invalid_session_exception.return_value = True
         mock_is_transaction_expired_exception.return_value = False
 
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
         mock_lambda = Mock()
-        mock_lambda.side_effect = ce
+        mock_lambda.side_effect = MOCK_CLIENT_ERROR
 
         with self.assertRaises(ExecuteError) as cm:
-            qldb_session._execute_lambda(mock_lambda)
+            self.qldb_session._execute_lambda(mock_lambda)
 
-        assert_execute_error(self, cm.exception, ce, False, True, mock_transaction.transaction_id)
+        assert_execute_error(self, cm.exception, MOCK_CLIENT_ERROR, False, True, mock_transaction.transaction_id)
         mock_no_throw_abort.assert_not_called()
-        self.assertFalse(qldb_session._is_alive)
+        self.assertFalse(self.qldb_session._is_alive)
         mock_transaction._commit.assert_not_called()
         mock_transaction._close_child_cursors.assert_called_once_with()
 
-    @patch('pyqldb.session.qldb_session.QldbSession._no_throw_abort')
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.is_occ_conflict_exception')
-    @patch('pyqldb.session.qldb_session.is_transaction_expired_exception')
-    @patch('pyqldb.session.qldb_session.is_invalid_session_exception')
-    @patch('pyqldb.session.qldb_session.is_retriable_exception')
-    @patch('pyqldb.session.qldb_session.Transaction')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.session.qldb_session.QldbSession._start_transaction')
-    def test_execute_lambda_expired_transaction_exception(self, mock_start_transaction, mock_session, mock_transaction,
-                                                          mock_is_retryable_exception, mock_is_invalid_session_exception,
-                                                          mock_is_transaction_expired_exception,
-                                                          mock_is_occ_conflict_exception, mock_executor,
-                                                          mock_no_throw_abort):
-        ce = ClientError(MOCK_CLIENT_ERROR_MESSAGE, 'message')
+    def test_execute_lambda_expired_transaction_exception(self):
+        mock_transaction = self.session_mocks['Transaction']
+        mock_is_retryable_exception = self.session_mocks['is_retriable_exception']
+        mock_is_invalid_session_exception = self.session_mocks['is_invalid_session_exception']
+        mock_is_transaction_expired_exception = self.session_mocks['is_transaction_expired_exception']
+        mock_is_occ_conflict_exception = self.session_mocks['is_occ_conflict_exception']
+        mock_start_transaction = self.qldb_session._start_transaction = Mock()
+        mock_no_throw_abort = self.qldb_session._no_throw_abort = Mock()
         mock_start_transaction.return_value = mock_transaction
         mock_transaction.transaction_id = 'transaction_id'
         mock_is_retryable_exception.return_value = False
@@ -204,60 +160,49 @@ class TestQldbSession(TestCase):
         mock_is_transaction_expired_exception.return_value = True
         mock_is_occ_conflict_exception.return_value = False
 
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
         mock_lambda = Mock()
-        mock_lambda.side_effect = ce
+        mock_lambda.side_effect = MOCK_CLIENT_ERROR
 
         with self.assertRaises(ExecuteError) as cm:
-            qldb_session._execute_lambda(mock_lambda)
+            self.qldb_session._execute_lambda(mock_lambda)
 
-        assert_execute_error(self, cm.exception, ce, False, True, mock_transaction.transaction_id)
+        assert_execute_error(self, cm.exception, MOCK_CLIENT_ERROR, False, True, mock_transaction.transaction_id)
         mock_no_throw_abort.assert_called_once_with()
-        self.assertTrue(qldb_session._is_alive)
+        self.assertTrue(self.qldb_session._is_alive)
         mock_transaction._commit.assert_not_called()
         mock_transaction._close_child_cursors.assert_called_once_with()
 
-    @patch('pyqldb.session.qldb_session.QldbSession._no_throw_abort')
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.is_invalid_session_exception')
-    @patch('pyqldb.session.qldb_session.is_retriable_exception')
-    @patch('pyqldb.session.qldb_session.is_occ_conflict_exception')
-    @patch('pyqldb.session.qldb_session.Transaction')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.session.qldb_session.QldbSession._start_transaction')
-    def test_execute_lambda_occ_conflict(self, mock_start_transaction, mock_session, mock_transaction,
-                                         mock_is_occ_conflict_exception, mock_is_retryable_exception,
-                                         mock_is_invalid_session_exception, mock_executor, mock_no_throw_abort):
-        ce = ClientError(MOCK_CLIENT_ERROR_MESSAGE, MOCK_MESSAGE)
+    def test_execute_lambda_occ_conflict(self):
+        mock_transaction = self.session_mocks['Transaction']
+        mock_is_retryable_exception = self.session_mocks['is_retriable_exception']
+        mock_is_invalid_session_exception = self.session_mocks['is_invalid_session_exception']
+        mock_is_occ_conflict_exception = self.session_mocks['is_occ_conflict_exception']
+        mock_start_transaction = self.qldb_session._start_transaction = Mock()
+        mock_no_throw_abort = self.qldb_session._no_throw_abort = Mock()
         mock_start_transaction.return_value = mock_transaction
         mock_transaction.transaction_id = 'transaction_id'
         mock_is_retryable_exception.return_value = False
         mock_is_invalid_session_exception.return_value = False
         mock_is_occ_conflict_exception.return_value = True
 
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
         mock_lambda = Mock()
-        mock_lambda.side_effect = ce
+        mock_lambda.side_effect = MOCK_CLIENT_ERROR
 
         with self.assertRaises(ExecuteError) as cm:
-            qldb_session._execute_lambda(mock_lambda)
+            self.qldb_session._execute_lambda(mock_lambda)
 
-        assert_execute_error(self, cm.exception, ce, False, False, mock_transaction.transaction_id)
+        assert_execute_error(self, cm.exception, MOCK_CLIENT_ERROR, False, False, mock_transaction.transaction_id)
         mock_no_throw_abort.assert_not_called()
         mock_transaction._commit.assert_not_called()
         mock_transaction._close_child_cursors.assert_called_once_with()
 
-    @patch('pyqldb.session.qldb_session.QldbSession._no_throw_abort')
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.is_invalid_session_exception')
-    @patch('pyqldb.session.qldb_session.is_retriable_exception')
-    @patch('pyqldb.session.qldb_session.is_occ_conflict_exception')
-    @patch('pyqldb.session.qldb_session.Transaction')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.session.qldb_session.QldbSession._start_transaction')
-    def test_execute_lambda_unknown_exception(self, mock_start_transaction, mock_session, mock_transaction,
-                                              mock_is_occ_conflict_exception, mock_is_retryable_exception,
-                                              mock_is_invalid_session_exception, mock_executor, mock_no_throw_abort):
+    def test_execute_lambda_unknown_exception(self):
+        mock_transaction = self.session_mocks['Transaction']
+        mock_is_retryable_exception = self.session_mocks['is_retriable_exception']
+        mock_is_invalid_session_exception = self.session_mocks['is_invalid_session_exception']
+        mock_is_occ_conflict_exception = self.session_mocks['is_occ_conflict_exception']
+        mock_start_transaction = self.qldb_session._start_transaction = Mock()
+        mock_no_throw_abort = self.qldb_session._no_throw_abort = Mock()
         error = KeyError()
         mock_start_transaction.return_value = mock_transaction
         mock_transaction.transaction_id = 'transaction_id'
@@ -266,31 +211,26 @@ class TestQldbSession(TestCase):
         mock_is_retryable_exception.return_value = False
         mock_is_invalid_session_exception.return_value = False
 
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
         mock_lambda = Mock()
         mock_lambda.side_effect = error
 
         with self.assertRaises(ExecuteError) as cm:
-            qldb_session._execute_lambda(mock_lambda)
+            self.qldb_session._execute_lambda(mock_lambda)
 
         assert_execute_error(self, cm.exception, error, False, False, mock_transaction.transaction_id)
-        self.assertTrue(qldb_session._is_alive)
+        self.assertTrue(self.qldb_session._is_alive)
         mock_no_throw_abort.assert_called_once_with()
         mock_transaction._commit.assert_not_called()
         mock_transaction._close_child_cursors.assert_called_once_with()
 
 
-    @patch('pyqldb.session.qldb_session.QldbSession._no_throw_abort')
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.is_invalid_session_exception')
-    @patch('pyqldb.session.qldb_session.is_retriable_exception')
-    @patch('pyqldb.session.qldb_session.is_occ_conflict_exception')
-    @patch('pyqldb.session.qldb_session.Transaction')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    @patch('pyqldb.session.qldb_session.QldbSession._start_transaction')
-    def test_execute_lambda_start_transaction_error(self, mock_start_transaction, mock_session, mock_transaction,
-                                                    mock_is_occ_conflict_exception, mock_is_retryable_exception,
-                                                    mock_is_invalid_session_exception, mock_executor, mock_no_throw_abort):
+    def test_execute_lambda_start_transaction_error(self):
+        mock_transaction = self.session_mocks['Transaction']
+        mock_is_retryable_exception = self.session_mocks['is_retriable_exception']
+        mock_is_invalid_session_exception = self.session_mocks['is_invalid_session_exception']
+        mock_is_occ_conflict_exception = self.session_mocks['is_occ_conflict_exception']
+        mock_start_transaction = self.qldb_session._start_transaction = Mock()
+        mock_no_throw_abort = self.qldb_session._no_throw_abort = Mock()
         error = KeyError()
         mock_start_transaction.side_effect = error
 
@@ -298,54 +238,36 @@ class TestQldbSession(TestCase):
         mock_is_retryable_exception.return_value = False
         mock_is_invalid_session_exception.return_value = False
 
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
         mock_lambda = Mock()
 
         with self.assertRaises(ExecuteError) as cm:
-            qldb_session._execute_lambda(mock_lambda)
+            self.qldb_session._execute_lambda(mock_lambda)
 
         assert_execute_error(self, cm.exception, error, False, False, None)
-        self.assertTrue(qldb_session._is_alive)
+        self.assertTrue(self.qldb_session._is_alive)
         mock_no_throw_abort.assert_called_once_with()
         mock_transaction._close_child_cursors.assert_not_called()
 
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.Transaction')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_start_transaction(self, mock_session, mock_transaction, mock_executor):
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-        mock_transaction.return_value = mock_transaction
-        mock_session._start_transaction.return_value = MOCK_TRANSACTION_RESULT
-        transaction = qldb_session._start_transaction()
-
-        mock_session._start_transaction.assert_called_once_with()
-        mock_transaction.assert_called_once_with(qldb_session._session, qldb_session._read_ahead, MOCK_TRANSACTION_ID,
-                                                 mock_executor)
-        self.assertEqual(transaction, mock_transaction)
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_no_throw_abort(self, mock_session, mock_executor):
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-        qldb_session._no_throw_abort()
-
-        mock_session._abort_transaction.assert_called_once_with()
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_no_throw_abort_transaction_is_none(self, mock_session, mock_executor):
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-        qldb_session._no_throw_abort()
-
-        mock_session._abort_transaction.assert_called_once_with()
-
-    @patch('concurrent.futures.thread.ThreadPoolExecutor')
-    @patch('pyqldb.session.qldb_session.logger.warning')
-    @patch('pyqldb.communication.session_client.SessionClient')
-    def test_no_throw_abort_client_error(self, mock_session, mock_logger_warning, mock_executor):
-        mock_session._abort_transaction.side_effect = ClientError(MOCK_CLIENT_ERROR_MESSAGE, 'message')
-        qldb_session = QldbSession(mock_session, MOCK_READ_AHEAD, mock_executor)
-        qldb_session._no_throw_abort()
-
-        self.assertFalse(qldb_session._is_alive)
+    def test_start_transaction(self):
+        mock_transaction = self.session_mocks['Transaction']
+        mock_transaction.return_value = sentinel.transaction
+        self.mock_session._start_transaction.return_value = MOCK_TRANSACTION_RESULT
+        transaction = self.qldb_session._start_transaction()
+
+        self.mock_session._start_transaction.assert_called_once_with()
+        mock_transaction.assert_called_once_with(self.mock_session, MOCK_READ_AHEAD, MOCK_TRANSACTION_ID,
+                                                 self.mock_executor)
+        self.assertIs(transaction, sentinel.transaction)
+
+    def test_no_throw_abort(self):
+        self.qldb_session._no_throw_abort()
+
+        self.mock_session._abort_transaction.assert_called_once_with()
+
+    @patch.object(qldb_session_module.logger, 'warning', new_callable=Mock)
+    def test_no_throw_abort_client_error(self, mock_logger_warning):
+        self.mock_session._abort_transaction.side_effect = MOCK_CLIENT_ERROR
+        self.qldb_session._no_throw_abort()
+
+        self.assertFalse(self.qldb_session._is_alive)
         mock_logger_warning.assert_called_once()